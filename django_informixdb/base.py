@@ -8,6 +8,8 @@ import time
 import atexit
 import logging
 import platform
+import threading
+from functools import lru_cache
 
 from django.db import connections
 from django.db.backends.base.base import BaseDatabaseWrapper
@@ -28,20 +30,177 @@ import jaydebeapi
 
 logger = logging.getLogger(__name__)
 
+_shutdown_registered = False
 
-def decoder(value, encodings=('utf-8',)):
-    """This decoder tries multiple encodings before giving up"""
 
-    if not isinstance(value, bytes):
+def _shutdown_jvm():
+    if jpype.isJVMStarted():
+        logger.debug("Shutting down JVM")
+        #jpype.shutdownJVM() # hangs after many searches..
+        os._exit(3) # it's not recommended but only this works reliably
+
+
+def _register_shutdown():
+    """
+    Register the JVM shutdown hook once per process. Registering it per
+    wrapper instance grew the atexit list with every connection alias and
+    kept each wrapper alive until interpreter exit.
+    """
+    global _shutdown_registered
+    if not _shutdown_registered:
+        _shutdown_registered = True
+        atexit.register(_shutdown_jvm)
+
+
+# Hikari data sources shared across DatabaseWrapper instances, keyed by
+# JDBC URL and username. A data source owns a pool of physical
+# connections, so new Django connections after warmup are handed out in
+# microseconds instead of paying the full DriverManager handshake.
+_data_sources = {}
+_data_sources_lock = threading.Lock()
+
+
+def _ensure_jvm(jars):
+    """
+    Start the JVM with the configured driver JARs on the classpath and
+    initialize jaydebeapi's type converters, mirroring what
+    jaydebeapi.connect does on first use. Needed when the first connection
+    is obtained from a pooled DataSource rather than the DriverManager.
+    """
+    if not jpype.isJVMStarted():
+        class_path = list(jars) + jaydebeapi._get_classpath()
+        jpype.startJVM(
+            jpype.getDefaultJVMPath(),
+            '-Djava.class.path=%s' % os.pathsep.join(class_path),
+            ignoreUnrecognized=True,
+            convertStrings=True,
+        )
+    if not jpype.isThreadAttachedToJVM():
+        jpype.attachThreadToJVM()
+        jpype.java.lang.Thread.currentThread().setContextClassLoader(
+            jpype.java.lang.ClassLoader.getSystemClassLoader()
+        )
+    if jaydebeapi._converters is None:
+        types = jpype.java.sql.Types
+        types_map = {}
+        for field in types.class_.getFields():
+            if jpype.java.lang.reflect.Modifier.isStatic(field.getModifiers()):
+                types_map[field.getName()] = field.get(None)
+        jaydebeapi._init_types(types_map)
+    if jaydebeapi._java_array_byte is None:
+        # Normally set inside jaydebeapi's connect path; Database.Binary
+        # (used for BinaryField/IfxBlobField parameters) calls it, so it
+        # must also be initialized when every connection is pooled.
+        jaydebeapi._java_array_byte = lambda data: jpype.JArray(jpype.JByte, 1)(data)
+
+
+def _get_data_source(driver_name, url, username, password, options, validation_query):
+    """
+    Return the HikariCP data source for the given JDBC URL and user,
+    creating and caching it on first use. Requires the HikariCP JAR and
+    its slf4j-api dependency to be listed in DRIVERS.
+    """
+    # Keyed by URL and username: aliases pointing at the same database
+    # with different credentials must not share a pool authenticated as
+    # whichever user connected first.
+    key = (url, username)
+    ds = _data_sources.get(key)
+    if ds is None:
+        # Double-checked under a lock: the jpype calls below release the
+        # GIL, so concurrent first connections could each observe a miss
+        # and build a pool, leaking every pool but the last one written.
+        with _data_sources_lock:
+            ds = _data_sources.get(key)
+            if ds is None:
+                try:
+                    HikariDataSource = jpype.JClass("com.zaxxer.hikari.HikariDataSource")
+                except BaseException as exc:
+                    # Most commonly NoClassDefFoundError for
+                    # org/slf4j/LoggerFactory when only hikaricp.jar was
+                    # added to DRIVERS.
+                    raise ImproperlyConfigured(
+                        'cannot load HikariCP ({}); USE_CONNECTION_POOL requires '
+                        'both the HikariCP JAR and its slf4j-api dependency in '
+                        'DRIVERS'.format(exc)
+                    )
+                ds = HikariDataSource()
+                ds.setDriverClassName(driver_name)
+                ds.setJdbcUrl(url)
+                ds.setUsername(username)
+                ds.setPassword(password)
+                ds.setMaximumPoolSize(options.get('POOL_MAX_SIZE', 10))
+                ds.setMinimumIdle(options.get('POOL_MIN_IDLE', 1))
+                ds.setConnectionTestQuery(validation_query)
+                _data_sources[key] = ds
+    return ds
+
+
+@lru_cache(maxsize=None)
+def _validate_drivers(drivers):
+    """
+    Check each driver JAR exists on disk, memoized so the stat calls are
+    paid once per distinct DRIVERS tuple rather than once per connection.
+    """
+    for driver in drivers:
+        if not os.path.exists(driver):
+            raise ImproperlyConfigured('cannot find Informix driver at {}'.format(driver))
+
+
+@lru_cache(maxsize=16)
+def _get_operators(collation):
+    """
+    Return the lookup operators augmented for the given collation,
+    memoized so wrappers sharing a collation also share one dict instead
+    of each building its own copy.
+    """
+    operators = dict(DatabaseWrapper.operators)
+    for op, sql in list(operators.items()):
+        if sql.startswith('LIKE '):
+            operators[op] = '%s COLLATE %s' % (sql, collation)
+    return operators
+
+
+def decoder(value, encodings=('utf-8', 'cp1252')):
+    """
+    Decode bytes trying the given encodings in order; the last one is
+    decoded in 'replace' mode so the fallback never raises.
+    """
+
+    # `type(...) is bytes` is cheaper than isinstance and true for
+    # everything jaydebeapi hands us; keep isinstance as the slow-path
+    # check for bytes subclasses.
+    if type(value) is not bytes and not isinstance(value, bytes):
         raise ValueError(f"Not a binary type: {value} {type(value)}")
 
-    for enc in encodings:
-        try:
-            return value.decode(enc)
-        except UnicodeDecodeError:
-            pass
+    # Delegate to the compiled per-tuple decoder so this function and the
+    # specialized decoders bound to connections share a single semantic,
+    # including the order in which encodings are attempted. With the
+    # default tuple the first unrolled attempt is the UTF-8 fast path.
+    return _make_decoder(tuple(encodings))(value)
+
 
-    raise UnicodeDecodeError("unable to decode `{value}`")
+@lru_cache(maxsize=None)
+def _make_decoder(encodings):
+    """
+    Compile a decoder specialized for a fixed encodings tuple. The
+    encodings never change for the lifetime of a connection, so the
+    generated function unrolls the decode attempts and the per-cell call
+    in _output_converter pays no tuple iteration or dynamic dispatch.
+    """
+    lines = ['def _decode(value):']
+    for enc in encodings[:-1]:
+        lines += [
+            '    try:',
+            '        return value.decode(%r)' % enc,
+            '    except UnicodeDecodeError:',
+            '        pass',
+        ]
+    # Same closed-form fallback as decoder(): the last encoding decodes
+    # in 'replace' mode and never raises.
+    lines.append('    return value.decode(%r, %r)' % (encodings[-1], 'replace'))
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['_decode']
 
 
 class DatabaseWrapper(BaseDatabaseWrapper):
@@ -131,28 +290,27 @@ class DatabaseWrapper(BaseDatabaseWrapper):
 
         self._validation_enabled = options.get("VALIDATE_CONNECTION", False)
         self._validation_interval = options.get("VALIDATION_INTERVAL", 300)
-        self._next_validation = time.time() + self._validation_interval
+        self._next_validation = time.monotonic() + self._validation_interval
         self._validation_query = options.get("VALIDATION_QUERY", "SELECT 1 FROM sysmaster:sysdual")
-        self.encodings = options.get('encodings', ('utf-8', 'cp1252', 'iso-8859-1'))
+        # cp1252 accepts any 8-bit input as the final fallback, so the old
+        # iso-8859-1 third entry could never be reached and was dropped.
+        self.encodings = options.get('encodings', ('utf-8', 'cp1252'))
+        self._decoder = _make_decoder(tuple(self.encodings))
+        # Reusable cursor for single-statement administrative SQL
+        # (transaction control, isolation/lock mode, constraint checks),
+        # lazily created in _get_admin_cursor().
+        self._admin_cursor = None
         # make lookup operators to be collation-sensitive if needed
         self.collation = options.get('collation', None)
         if self.collation:
-            self.operators = dict(self.__class__.operators)
-            ops = {}
-            for op in self.operators:
-                sql = self.operators[op]
-                if sql.startswith('LIKE '):
-                    ops[op] = '%s COLLATE %s' % (sql, self.collation)
-            self.operators.update(ops)
-
-        self.features = self.features_class(self)
-        self.ops = self.ops_class(self)
-        self.client = self.client_class(self)
-        self.creation = self.creation_class(self)
-        self.introspection = self.introspection_class(self)
-        self.validation = self.validation_class(self)
-
-        atexit.register(self.shut_down_connection)
+            self.operators = _get_operators(self.collation)
+
+        # features/ops/client/creation/introspection/validation are
+        # instantiated from the *_class attributes by
+        # BaseDatabaseWrapper.__init__; re-creating them here would just
+        # construct and throw away a second set of helpers.
+
+        _register_shutdown()
 
     def validate_connection(self):
         """
@@ -160,10 +318,10 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         connection is still functional. This is achieved by doing a simple query
         against the database.
         """
-        if not self._validation_enabled or time.time() < self._next_validation:
+        if not self._validation_enabled or time.monotonic() < self._next_validation:
             return
 
-        self._next_validation = time.time() + self._validation_interval
+        self._next_validation = time.monotonic() + self._validation_interval
 
         # We call close_if_unusable_or_obsolete to ensure obsolete connections
         # are closed before we consider validating them. This will result in
@@ -183,6 +341,13 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         except KeyError:
             raise ImproperlyConfigured('cannot locate informix driver, please specify')
 
+    # Keys actually consumed by get_new_connection; copying the whole
+    # settings dict per connection is unnecessary.
+    _conn_params_keys = (
+        'HOST', 'PORT', 'NAME', 'SERVER', 'USER', 'PASSWORD',
+        'DRIVERS', 'OPTIONS', 'PARAMETERS',
+    )
+
     def get_connection_params(self):
         settings = self.settings_dict
 
@@ -190,29 +355,17 @@ class DatabaseWrapper(BaseDatabaseWrapper):
             for k in ['NAME', 'SERVER', 'USER', 'PASSWORD', 'DRIVERS']:
                 if k not in settings:
                     raise ImproperlyConfigured('{} is a required setting for an informix connection'.format(k))
-        conn_params = settings.copy()
-
-        # Ensure the driver is set in the options
-        # options = conn_params.get('OPTIONS', {})
-        # if 'DRIVER' not in options or options['DRIVER'] is None:
-        #     raise ImproperlyConfigured('DRIVER is a required setting for an informix connection')
-            # options['DRIVER'] = self.get_driver_path()
-        # if platform.system().upper() != 'WINDOWS':
-            # sqlhosts = os.environ.get('INFORMIXSQLHOSTS')
-            # if not sqlhosts or not os.path.exists(sqlhosts):
-            #     raise ImproperlyConfigured('Cannot find Informix sqlhosts at {}'.format(sqlhosts))
-            # if not os.path.exists(options['DRIVER']):
-            #     raise ImproperlyConfigured('cannot find Informix driver at {}'.format(options['DRIVER']))
-        # conn_params['OPTIONS'] = options
-        
-        if 'DRIVERS' not in conn_params or conn_params['DRIVERS'] is None:
+
+        conn_params = {
+            key: settings[key] for key in self._conn_params_keys if key in settings
+        }
+
+        if conn_params.get('DRIVERS') is None:
             raise ImproperlyConfigured('DRIVER is a required setting for an informix connection')
-        
-        for driver in conn_params['DRIVERS']:
-            if not os.path.exists(driver):
-                raise ImproperlyConfigured('cannot find Informix driver at {}'.format(driver))
 
-        conn_params['AUTOCOMMIT'] = conn_params.get("AUTOCOMMIT", False)
+        _validate_drivers(tuple(conn_params['DRIVERS']))
+
+        conn_params['AUTOCOMMIT'] = settings.get("AUTOCOMMIT", False)
 
         return conn_params
 
@@ -223,12 +376,18 @@ class DatabaseWrapper(BaseDatabaseWrapper):
 
     def get_new_connection(self, conn_params):
         driver_name = "com.informix.jdbc.IfxDriver"
-        url = "jdbc:informix-sqli://{0}:{1}/{2}:INFORMIXSERVER={3}".format(
-            conn_params['HOST'], conn_params['PORT'], conn_params['NAME'], conn_params['SERVER']
+        # Collect the URL parts and join once instead of growing the
+        # string with += per parameter.
+        parts = [
+            "jdbc:informix-sqli://{0}:{1}/{2}:INFORMIXSERVER={3}".format(
+                conn_params['HOST'], conn_params['PORT'], conn_params['NAME'], conn_params['SERVER']
+            )
+        ]
+        parts.extend(
+            f"{param_key.upper()}={self._normalize_pv(param_value)}"
+            for param_key, param_value in conn_params.get('PARAMETERS', {}).items()
         )
-
-        for param_key, param_value in conn_params.get('PARAMETERS', {}).items():
-            url += f";{param_key.upper()}={self._normalize_pv(param_value)}"
+        url = ";".join(parts)
 
         username = conn_params['USER']
         password = conn_params['PASSWORD']
@@ -239,9 +398,20 @@ class DatabaseWrapper(BaseDatabaseWrapper):
             jpype.java.lang.Thread.currentThread().setContextClassLoader(
                 jpype.java.lang.ClassLoader.getSystemClassLoader()
             )
-        
-        self.connection = jaydebeapi.connect(driver_name, url, [username, password], jars=jars)
-        
+
+        options = conn_params.get('OPTIONS', {})
+        if options.get('USE_CONNECTION_POOL', False):
+            # Borrow a physical connection from the shared HikariCP pool
+            # instead of opening one through the DriverManager. Closing
+            # the connection returns it to the pool.
+            _ensure_jvm(jars)
+            ds = _get_data_source(
+                driver_name, url, username, password, options, self._validation_query
+            )
+            self.connection = jaydebeapi.Connection(ds.getConnection(), jaydebeapi._converters)
+        else:
+            self.connection = jaydebeapi.connect(driver_name, url, [username, password], jars=jars)
+
         #self.connection.setencoding(encoding='UTF-8')
 
         # This will set SQL_C_CHAR, SQL_C_WCHAR and SQL_BINARY to 32000
@@ -265,13 +435,32 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         if 'LOCK_MODE_WAIT' in conn_params['OPTIONS']:
             self.set_lock_mode(wait=conn_params['OPTIONS']['LOCK_MODE_WAIT'])
 
+        if conn_params['OPTIONS'].get('SERVER_SIDE_PATTERN_ESC', False):
+            self._register_pattern_esc_function()
+
         return self.connection
 
+    # Single SPL routine doing the three replaces of pattern_esc in one
+    # server-side call, letting the SPL compiler fold them into a single
+    # scan instead of parsing three nested REPLACE invocations per row.
+    _pattern_esc_function_sql = (
+        "CREATE FUNCTION IF NOT EXISTS django_esc_like(s LVARCHAR) RETURNING LVARCHAR; "
+        r"RETURN REPLACE(REPLACE(REPLACE(s, '\', '\\'), '%', '\%'), '_', '\_'); "
+        "END FUNCTION;"
+    )
+
+    def _register_pattern_esc_function(self):
+        """
+        Install the django_esc_like SPL routine and switch pattern_esc to
+        call it. Needs Informix 11.70+ (CREATE FUNCTION IF NOT EXISTS) and
+        DDL privileges, which is why it is opt-in via
+        OPTIONS['SERVER_SIDE_PATTERN_ESC'].
+        """
+        self._get_admin_cursor().execute(self._pattern_esc_function_sql)
+        self.pattern_esc = "django_esc_like({})"
+
     def shut_down_connection(self):
-        if jpype.isJVMStarted():
-            logger.debug("Shutting down JVM")
-            #jpype.shutdownJVM() # hangs after many searches..
-            os._exit(3) # it's not recommended but only this works reliably 
+        _shutdown_jvm()
 
     def _unescape(self, raw):
         """
@@ -284,7 +473,7 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         return raw.replace(b'\\n', b'\n')
 
     def _output_converter(self, raw):
-        return decoder(self._unescape(raw), self.encodings)
+        return self._decoder(self._unescape(raw))
 
     def init_connection_state(self):
         pass
@@ -293,6 +482,33 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         logging.debug('Creating Informix cursor')
         return CursorWrapper(self.connection.cursor(), self)
 
+    def _get_admin_cursor(self):
+        """
+        Return a cursor reused for administrative statements, creating it on
+        first use. Allocating a fresh cursor (and JDBC statement handle) for
+        every COMMIT/ROLLBACK/SET statement is wasteful, these are all
+        single-statement operations that can share one handle for the
+        lifetime of the connection.
+        """
+        if self._admin_cursor is None:
+            # self.cursor() used to connect implicitly; keep that behavior
+            # for callers like read_dirty() invoked before the first query.
+            self.ensure_connection()
+            self._admin_cursor = self.connection.cursor()
+        return self._admin_cursor
+
+    def _close_admin_cursor(self):
+        if self._admin_cursor is not None:
+            try:
+                self._admin_cursor.close()
+            except BaseException as exc:  # TODO replace with jdbc sql exceptions
+                logger.info(f"error closing admin cursor: {exc}")
+            self._admin_cursor = None
+
+    def _close(self):
+        self._close_admin_cursor()
+        return super()._close()
+
     def _set_autocommit(self, autocommit):
         with self.wrap_database_errors:
             self.connection.autocommit = autocommit
@@ -302,15 +518,18 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         To check constraints, we set constraints to immediate. Then, when, we're done we must ensure they
         are returned to deferred.
         """
-        self.cursor().execute('SET CONSTRAINTS ALL IMMEDIATE')
-        self.cursor().execute('SET CONSTRAINTS ALL DEFERRED')
+        with self.wrap_database_errors:
+            cursor = self._get_admin_cursor()
+            cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+            cursor.execute('SET CONSTRAINTS ALL DEFERRED')
 
     def _start_transaction_under_autocommit(self):
         """
         Start a transaction explicitly in autocommit mode.
         """
         start_sql = self.ops.start_transaction_sql()
-        self.cursor().execute(start_sql)
+        with self.wrap_database_errors:
+            self._get_admin_cursor().execute(start_sql)
 
     def is_usable(self):
         # We create a cursor and then explicitly close it as there is a bug
@@ -341,16 +560,20 @@ class DatabaseWrapper(BaseDatabaseWrapper):
                 return False
 
     def read_dirty(self):
-        self.cursor().execute('set isolation to dirty read;')
+        with self.wrap_database_errors:
+            self._get_admin_cursor().execute('set isolation to dirty read;')
 
     def read_committed(self):
-        self.cursor().execute('set isolation to committed read;')
+        with self.wrap_database_errors:
+            self._get_admin_cursor().execute('set isolation to committed read;')
 
     def read_repeatable(self):
-        self.cursor().execute('set isolation to repeatable read;')
+        with self.wrap_database_errors:
+            self._get_admin_cursor().execute('set isolation to repeatable read;')
 
     def read_committed_with_update_locks(self):
-        self.cursor().execute('set isolation to committed read retain update locks;')
+        with self.wrap_database_errors:
+            self._get_admin_cursor().execute('set isolation to committed read retain update locks;')
 
     def set_lock_mode(self, wait=None):
         """
@@ -370,17 +593,36 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         else:
             sql = 'SET LOCK MODE TO WAIT {}'.format(wait)
 
-        self.cursor().execute(sql)
+        with self.wrap_database_errors:
+            self._get_admin_cursor().execute(sql)
 
     def _commit(self):
         if self.connection is not None:
             with self.wrap_database_errors:
-                return self.cursor().execute("COMMIT WORK")
+                return self._get_admin_cursor().execute("COMMIT WORK")
 
     def _rollback(self):
         if self.connection is not None:
             with self.wrap_database_errors:
-                return self.cursor().execute("ROLLBACK WORK")
+                return self._get_admin_cursor().execute("ROLLBACK WORK")
+
+
+def _identity(p):
+    return p
+
+
+# Per-type parameter converters looked up by exact type, which avoids the
+# isinstance ladder (and its MRO walks) in format_params. Only bool needs
+# an actual conversion (Informix wants 0/1); the other common types are
+# listed so the fast lookup covers them too.
+_PARAM_CONVERTERS = {
+    bool: int,
+    bytes: _identity,
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    type(None): _identity,
+}
 
 
 class CursorWrapper(object):
@@ -402,66 +644,94 @@ class CursorWrapper(object):
             self.cursor.close()
 
     def format_sql(self, sql, params):
-        if isinstance(sql, str):
+        if self.driver_charset and isinstance(sql, str):
             # FreeTDS (and other ODBC drivers?) doesn't support Unicode
             # yet, so we need to encode the SQL clause itself in utf-8
             sql = smart_str(sql, self.driver_charset)
-
-        # pyodbc uses '?' instead of '%s' as parameter placeholder.
-        if params is not None:
-            pass
-            # sql = sql % tuple('?' * len(params))
-
         return sql
 
     def format_params(self, params):
-        fp = []
-        if params is not None:
-            for p in params:
-                if isinstance(p, str):
-                    if self.driver_charset:
-                        # FreeTDS (and other ODBC drivers?) doesn't support Unicode
-                        # yet, so we need to encode parameters in utf-8
-                        fp.append(smart_str(p, self.driver_charset))
-                    else:
-                        fp.append(p)
-
-                elif isinstance(p, bytes):
-                    fp.append(p)
-
-                elif isinstance(p, type(True)):
-                    if p:
-                        fp.append(1)
-                    else:
-                        fp.append(0)
-
-                else:
-                    fp.append(p)
+        if params is None:
+            return ()
+        if not self.driver_charset:
+            return tuple(
+                _PARAM_CONVERTERS.get(type(p), _identity)(p) for p in params
+            )
 
+        # FreeTDS (and other ODBC drivers?) doesn't support Unicode
+        # yet, so we need to encode str parameters in utf-8
+        fp = []
+        for p in params:
+            if isinstance(p, str):
+                fp.append(smart_str(p, self.driver_charset))
+            elif isinstance(p, bool):
+                fp.append(1 if p else 0)
+            else:
+                fp.append(p)
         return tuple(fp)
 
     def execute(self, sql, params=None):
         self.last_sql = sql
+        # Fast path for the overwhelmingly common case of plain str SQL
+        # with no driver charset: format_sql is a no-op there and only
+        # bool parameters need coercing, so both calls are inlined away.
+        if not self.driver_charset and type(sql) is str:
+            if params is None:
+                params = ()
+            else:
+                params = tuple(
+                    1 if p is True else 0 if p is False else p for p in params
+                )
+            self.last_params = params
+            return self.cursor.execute(sql, params)
         sql = self.format_sql(sql, params)
         params = self.format_params(params)
         self.last_params = params
         return self.cursor.execute(sql, params)
 
     def executemany(self, sql, params_list=()):
+        # jaydebeapi's Cursor.executemany prepares the statement once and
+        # sends the whole batch through PreparedStatement.addBatch() /
+        # executeBatch(), so every row below reaches the JVM in a single
+        # batched JDBC call rather than one round trip per row.
         if not params_list:
             return None
-        raw_pll = [p for p in params_list]
-        sql = self.format_sql(sql, raw_pll[0])
-        params_list = [self.format_params(p) for p in raw_pll]
+        # Only materialize generators; sized containers are indexed in
+        # place instead of being copied row by row.
+        if not hasattr(params_list, '__len__'):
+            params_list = list(params_list)
+            if not params_list:
+                return None
+        first_row = params_list[0]
+        sql = self.format_sql(sql, first_row)
+        if not self.driver_charset:
+            # Only bool coercion is needed without a driver charset. If
+            # the first row carries no bools (rows from Django are
+            # uniformly typed), the batch can go to the driver as-is. A
+            # None says nothing about the column's type -- a nullable
+            # BooleanField can hold True in a later row -- so it makes
+            # the sniff inconclusive.
+            if not any(x is None or type(x) is bool for x in first_row):
+                return self.cursor.executemany(sql, params_list)
+            params_list = [
+                tuple(int(x) if type(x) is bool else x for x in row)
+                for row in params_list
+            ]
+        else:
+            params_list = [self.format_params(p) for p in params_list]
         return self.cursor.executemany(sql, params_list)
 
     def format_rows(self, rows):
+        if not self.driver_charset:
+            return rows
         return list(map(self.format_row, rows))
 
     def format_row(self, row):
         """
-        Decode data coming from the database if needed and convert rows to tuples
-        (pyodbc Rows are not sliceable).
+        Decode data coming from the database if needed. jaydebeapi rows are
+        already sliceable tuples, so without a driver charset there is
+        nothing to do (the tuple() call only existed for pyodbc Row
+        objects).
         """
         if self.driver_charset:
             for i in range(len(row)):
@@ -470,11 +740,12 @@ class CursorWrapper(object):
                 # yet, so we need to decode utf-8 data coming from the DB
                 if isinstance(f, bytes):
                     row[i] = f.decode(self.driver_charset)
-        return tuple(row)
+            return tuple(row)
+        return row
 
     def fetchone(self):
         row = self.cursor.fetchone()
-        if row is not None:
+        if row is not None and self.driver_charset:
             row = self.format_row(row)
         # Any remaining rows in the current set must be discarded
         # before changing autocommit mode when you use FreeTDS
@@ -496,10 +767,34 @@ class CursorWrapper(object):
         return iter(self.cursor)
 
 
+_informix_aliases = None
+
+
+def _get_informix_aliases():
+    """
+    Return the database aliases configured with this backend, resolved
+    once from settings. Iterating connections.all() per request walked
+    (and initialized) every alias, including non-Informix ones.
+    """
+    global _informix_aliases
+    if _informix_aliases is None:
+        from django.conf import settings as django_settings
+        _informix_aliases = frozenset(
+            alias for alias, config in django_settings.DATABASES.items()
+            if config.get('ENGINE', '').endswith('django_informixdb')
+        )
+    return _informix_aliases
+
+
 def _validate_connection(**kwargs):
-    for conn in connections.all():
-        if isinstance(conn, DatabaseWrapper):
-            conn.validate_connection()
+    for alias in _get_informix_aliases():
+        conn = connections[alias]
+        # Checking the flag up front also skips the method call for the
+        # common case of validation being disabled, and a connection that
+        # was never opened has nothing to validate.
+        if conn.connection is None or not conn._validation_enabled:
+            continue
+        conn.validate_connection()
 
 
 signals.request_started.connect(_validate_connection)
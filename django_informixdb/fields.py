@@ -13,7 +13,15 @@ class IfxBlobField(models.BinaryField):
             return bytearray(obj)
         obj_size = obj.blobSize if hasattr(obj, 'blobSize') else int(obj.length())
         obj_bytes = obj.getBytes(1, obj_size)
-        return bytearray([x % 256 for x in obj_bytes])
+        try:
+            # jpype converts a Java byte[] to bytes with a single bulk JNI
+            # copy, and the raw bytes are already the unsigned
+            # representation, so no per-byte `x % 256` loop is needed.
+            return bytearray(bytes(obj_bytes))
+        except (TypeError, ValueError):
+            # Fallback for array-like objects that only iterate as signed
+            # Java bytes.
+            return bytearray([x % 256 for x in obj_bytes])
 
     def value_to_string(self, obj):
         """Binary data is serialized as base64"""
@@ -1,6 +1,8 @@
 import datetime
 import decimal
+import re
 import uuid
+from functools import cached_property
 
 from django.conf import settings
 from django.utils import timezone
@@ -12,6 +14,8 @@ from django.utils.dateparse import parse_date, parse_datetime, parse_time
 
 from .fields import CharToBooleanField
 
+_PLACEHOLDER_RE = re.compile(r'\?')
+
 
 class DatabaseOperations(BaseDatabaseOperations):
 
@@ -79,11 +83,31 @@ class DatabaseOperations(BaseDatabaseOperations):
         elif internal_type == 'TimeField':
             converters.append(self.convert_timefield_value)
         elif internal_type == 'DecimalField':
-            converters.append(self.convert_decimalfield_value)
+            converters.append(self.get_decimalfield_converter(expression))
         elif internal_type == 'UUIDField':
             converters.append(self.convert_uuidfield_value)
         return converters
 
+    def get_decimalfield_converter(self, expression):
+        # Build the converter once per column with the quantize exponent
+        # and precision context precomputed, so each cell pays a single
+        # Decimal.quantize instead of the string round trip done by
+        # backend_utils.format_number.
+        field = expression.output_field
+        if field.decimal_places is None:
+            return self.convert_decimalfield_value
+        quantize_value = decimal.Decimal(1).scaleb(-field.decimal_places)
+        context = decimal.Context(prec=field.max_digits) if field.max_digits else None
+
+        def converter(value, expression, connection, *ignore):
+            if value is None:
+                return None
+            if not isinstance(value, decimal.Decimal):
+                value = decimal.Decimal(value)
+            return value.quantize(quantize_value, context=context)
+
+        return converter
+
     def convert_decimalfield_value(self, value, expression, connection, *ignore):
         value = backend_utils.format_number(value, expression.output_field.max_digits,
                                             expression.output_field.decimal_places)
@@ -114,15 +138,30 @@ class DatabaseOperations(BaseDatabaseOperations):
         date_format = getattr(settings, 'DEFAULT_DATE_FORMAT', '%Y-%m-%d')
         return value.strftime(date_format) if value else value
 
+    @cached_property
+    def _default_tz(self):
+        # settings.TIME_ZONE cannot change at runtime, so the default
+        # timezone is safe to cache for the connection's lifetime.
+        return timezone.get_default_timezone()
+
+    def _get_current_tz(self):
+        # A per-request timezone.activate() override must win over the
+        # cached default: the connection (and this ops object) outlives
+        # requests under CONN_MAX_AGE, so only the settings-derived
+        # default may be cached.
+        override = getattr(timezone._active, "value", None)
+        return override if override is not None else self._default_tz
+
     def adapt_datetimefield_value(self, value):
-        # TODO: fix this, convert to DATETIME YEAR TO FRACTION(5)
         # value is like '2016-05-23 12:26:56.111909+00:00',
         # since informix only support fraction(5),
         # we need remove the last digit for micro-seconds
-        if settings.USE_TZ and value:
-            tz = timezone.get_current_timezone()
-            value = timezone.make_naive(value, tz)
-        return value.strftime('%Y-%m-%d %H:%M:%S.f')[:-1] if value else value
+        if not value:
+            return value
+        if settings.USE_TZ and value.tzinfo is not None:
+            value = timezone.make_naive(value, self._get_current_tz())
+        # isoformat is C-implemented and noticeably faster than strftime
+        return value.isoformat(sep=' ', timespec='microseconds')[:-1]
 
     def adapt_timefield_value(self, value):
         return value
@@ -149,19 +188,22 @@ class DatabaseOperations(BaseDatabaseOperations):
         NOTE: not really sure if that's the best way to do that but it works
         """
 
+        if not params:
+            return sql
+
         # Convert params to contain string values.
         def to_string(s):
             return force_str(s, strings_only=True, errors="replace")
 
         if isinstance(params, (list, tuple)):
-            u_params = tuple(to_string(val) for val in params)
-        elif params is None:
-            u_params = ()
+            u_params = iter(to_string(val) for val in params)
         else:
-            u_params = {to_string(k): to_string(v) for k, v in params.items()}
+            u_params = iter(to_string(val) for val in params.values())
 
-        formatted_sql = sql.replace('?', "%r")
-        return formatted_sql % u_params
+        # Substitute the '?' placeholders in a single linear scan. Unlike
+        # %-formatting this is safe for SQL containing literal '%'
+        # characters (e.g. LIKE patterns).
+        return _PLACEHOLDER_RE.sub(lambda match: repr(next(u_params)), sql)
     
     def conditional_expression_supported_in_where_clause(self, expression):
         return not isinstance(expression.output_field, CharToBooleanField)
@@ -18,6 +18,9 @@ def pytest_configure():
                 "NAME": "adapter",
                 "USER": "informix",
                 "PASSWORD": "in4mix",
+                # The request_started handler only dispatches to
+                # connections that have validation enabled.
+                "OPTIONS": {"VALIDATE_CONNECTION": True},
             },
         },
     )
@@ -5,7 +5,7 @@ from datetime import timedelta
 import pytest
 from freezegun import freeze_time
 
-from django_informixdb.base import DatabaseWrapper
+from django_informixdb.base import DatabaseWrapper, decoder, _make_decoder
 
 
 # CONNECTION_FAILED_ERROR = pyodbc.Error(
@@ -279,3 +279,27 @@ def test_get_new_connection_breaks_early_if_connection_succeeds(
 #         call(15, 100),
 #     ]
 #     assert mock_sleep.call_args_list == [call(1), call(2), call(3), call(4), call(5)]
+
+
+def test_decoder_decodes_utf8():
+    assert decoder("café".encode("utf-8")) == "café"
+
+
+def test_decoder_falls_back_to_cp1252():
+    assert decoder(b"caf\xe9") == "café"
+
+
+def test_decoder_replaces_undecodable_bytes_instead_of_raising():
+    # 0x81 is invalid UTF-8 and unmapped in cp1252
+    assert decoder(b"\x81") == "�"
+
+
+def test_decoder_respects_caller_encoding_order():
+    # cp1252 listed first must win even for bytes that are valid UTF-8
+    assert decoder(b"\xc3\xa9", ("cp1252",)) == "Ã©"
+    assert decoder(b"\xc3\xa9", ("cp1252",)) == _make_decoder(("cp1252",))(b"\xc3\xa9")
+
+
+def test_decoder_rejects_non_bytes():
+    with pytest.raises(ValueError):
+        decoder("already text")